@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from django.core.cache import cache
+
+DEPARTMENT_TREE_CACHE_KEY = "core:department_tree"
+DEPARTMENT_TREE_CACHE_TTL = 60
+
+# Held while a background seed runs; the timeout frees it if the worker dies mid-run.
+SEED_LOCK_KEY = "core:seed_running"
+SEED_LOCK_TIMEOUT = 60 * 60
+
+
+def invalidate_department_tree_cache() -> None:
+    """Drop the cached tree; call after writes that bypass model signals (bulk_create, COPY, TRUNCATE)."""
+    cache.delete(DEPARTMENT_TREE_CACHE_KEY)
@@ -1,17 +1,59 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import random
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import timedelta
-from typing import Iterable, List, Sequence, Tuple
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, List, Sequence, Tuple
 
+import django
 from django.core.management.base import BaseCommand
 from django.db import connection, transaction
 from django.utils import timezone
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: fall back to the pure-Python row generator.
+    np = None
+
+from ...cache import invalidate_department_tree_cache
 from ...models import Department, Employee, Role
 
 
+# (full_name, role_id, employment_date, salary, department_id)
+EmployeeRow = Tuple[str, int, datetime, int, int]
+
+EMPLOYEE_COLUMNS = ("full_name", "role_id", "employment_date", "salary", "department_id")
+
+# PostgreSQL accepts at most 65535 bind parameters per statement:
+# https://www.postgresql.org/docs/current/limits.html
+PG_MAX_QUERY_PARAMS = 65_535
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+FIRST_NAMES = (
+    "Данил", "Иван", "Глеб", "Святослав", "Петр", "Николай", "Августин",
+    "Икакий", "Александр", "Матвей",
+)
+LAST_NAMES = (
+    "Федоров", "Якимов", "Петров", "Сапожников", "Курдюмов", "Хлебников",
+    "Исаев", "Пушкарев",
+)
+MIDDLE_NAMES = (
+    "Евгеньевич", "Сергеевич", "Александрович", "Иванович", "Глебович",
+    "Святославович", "Николаевич", "Августинович",
+)
+
+# Every "First Last Middle #" combination: picking one is distributed exactly like picking the
+# three parts independently, but costs one draw and one concatenation per row.
+_NAME_PREFIXES = tuple(
+    f"{fn} {ln} {mn} #" for fn in FIRST_NAMES for ln in LAST_NAMES for mn in MIDDLE_NAMES
+)
+
+
 @dataclass(frozen=True)
 class SeedConfig:
     employees: int = 60_000
@@ -21,6 +63,12 @@ class SeedConfig:
     seed: int = 42
     batch_size: int = 5_000
     truncate: bool = False
+    workers: int = 1
+    use_copy: bool = True
+
+
+# (cfg, role_ids_defaults, dept_ids, now, first_block, block_count) for one worker process
+_EmployeeChunk = Tuple[SeedConfig, List[Tuple[int, int]], List[int], datetime, int, int]
 
 
 class Command(BaseCommand):
@@ -31,13 +79,33 @@ class Command(BaseCommand):
         parser.add_argument("--departments", type=int, default=25)
         parser.add_argument("--levels", type=int, default=5)
         parser.add_argument("--roles", type=int, default=10)
-        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=42,
+            help="Random seed. Employees are drawn per --batch-size block, so the data depends on "
+            "--seed and --batch-size (not on --workers), and on whether NumPy is installed: "
+            "it uses a different random stream than the pure-Python generator.",
+        )
         parser.add_argument("--batch-size", type=int, default=5_000)
         parser.add_argument(
             "--truncate",
             action="store_true",
             help="Truncate Role/Department/Employee tables before seeding (fast reset).",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Processes used to generate and load employees on PostgreSQL (default: 1). "
+            "With more than one, each worker commits separately: a failed run keeps the "
+            "truncate, roles, departments and part of the employees.",
+        )
+        parser.add_argument(
+            "--no-copy",
+            action="store_true",
+            help="Load employees with multi-row INSERTs instead of COPY (PostgreSQL only).",
+        )
 
     def handle(self, *args, **options):
         cfg = SeedConfig(
@@ -48,6 +116,8 @@ class Command(BaseCommand):
             seed=int(options["seed"]),
             batch_size=_require_positive_int(options["batch_size"], "batch_size"),
             truncate=bool(options["truncate"]),
+            workers=_require_positive_int(options["workers"], "workers"),
+            use_copy=not options["no_copy"],
         )
 
         if cfg.levels != 5:
@@ -57,13 +127,30 @@ class Command(BaseCommand):
 
         rnd = random.Random(cfg.seed)
 
-        with transaction.atomic():
-            if cfg.truncate:
-                _truncate_tables([Employee, Department, Role])
+        # Inside a caller's transaction workers could not see uncommitted rows, and closing the
+        # connection would abort that transaction: stay single-process there.
+        parallel = (
+            cfg.workers > 1 and connection.vendor == "postgresql" and not connection.in_atomic_block
+        )
 
-            roles = _ensure_roles(cfg, rnd)
-            departments = _ensure_department_tree(cfg, rnd)
-            _seed_employees(cfg, rnd, roles, departments)
+        try:
+            with transaction.atomic():
+                if cfg.truncate:
+                    _truncate_tables([Employee, Department, Role])
+
+                roles = _ensure_roles(cfg, rnd)
+                departments = _ensure_department_tree(cfg, rnd)
+                if not parallel:
+                    _seed_employees(cfg, roles, departments)
+
+            # Worker processes use their own connections, so roles and departments must be
+            # committed before they start.
+            if parallel:
+                _seed_employees(cfg, roles, departments)
+        finally:
+            # None of the bulk writes above send model signals, and a failed parallel load
+            # still leaves the committed truncate and departments behind.
+            invalidate_department_tree_cache()
 
         self.stdout.write(self.style.SUCCESS("Seeding completed successfully."))
 
@@ -81,12 +168,14 @@ def _require_positive_int(value: int, name: str) -> int:
 
 def _truncate_tables(models: Sequence[type]) -> None:
     """
-    TRUNCATE tables in dependency-safe order with CASCADE.
+    TRUNCATE all given tables in a single statement.
 
-    PostgreSQL TRUNCATE is fast and resets identity sequences.
+    PostgreSQL TRUNCATE is fast and resets identity sequences. The list must contain every
+    table referencing one of the others: without CASCADE, PostgreSQL rejects the statement
+    instead of silently emptying an unlisted referencing table.
     """
     table_names = [m._meta.db_table for m in models]
-    sql = "TRUNCATE TABLE {} RESTART IDENTITY CASCADE;".format(
+    sql = "TRUNCATE TABLE {} RESTART IDENTITY;".format(
         ", ".join(connection.ops.quote_name(t) for t in table_names)
     )
     with connection.cursor() as cursor:
@@ -122,8 +211,26 @@ def _ensure_roles(cfg: SeedConfig, rnd: random.Random) -> List[Role]:
         default_salary = rnd.randint(50_000, 140_000)
         roles_to_create.append(Role(name=name, default_salary=default_salary))
 
-    Role.objects.bulk_create(roles_to_create, batch_size=cfg.batch_size)
-    return list(Role.objects.all().only("id", "default_salary"))
+    return _bulk_create_with_pks(Role, roles_to_create, cfg.batch_size)
+
+
+def _safe_batch(model: type, desired: int) -> int:
+    """Cap a bulk_create batch so rows * columns stays within the bind parameter limit."""
+    return max(1, min(desired, PG_MAX_QUERY_PARAMS // len(model._meta.concrete_fields)))
+
+
+def _bulk_create_with_pks(model: type, objs: List, batch_size: int) -> List:
+    """
+    bulk_create ``objs`` and return them with primary keys set.
+
+    Backends with ``can_return_rows_from_bulk_insert`` (PostgreSQL; SQLite 3.35+ and
+    MariaDB 10.5+ since Django 4.0) fill pks from INSERT ... RETURNING. Elsewhere the
+    newest rows are read back, which is only valid while nothing else inserts concurrently.
+    """
+    created = model.objects.bulk_create(objs, batch_size=_safe_batch(model, batch_size))
+    if connection.features.can_return_rows_from_bulk_insert:
+        return created
+    return list(model.objects.order_by("-pk")[: len(objs)])[::-1]
 
 
 def _ensure_department_tree(cfg: SeedConfig, rnd: random.Random) -> List[Department]:
@@ -140,16 +247,67 @@ def _ensure_department_tree(cfg: SeedConfig, rnd: random.Random) -> List[Departm
 
     counts = [1, 3, 5, 7, 9]
 
-    created: List[Department] = []
-    parents: List[Department] = []
+    if connection.vendor == "postgresql":
+        created = _insert_department_tree(counts[: cfg.levels])
+    else:
+        created = _bulk_create_department_levels(cfg, counts)
+
+    if len(created) != cfg.departments:
+        raise RuntimeError(f"Department creation mismatch: expected {cfg.departments}, got {len(created)}")
+
+    return created
+
+
+def _insert_department_tree(counts: Sequence[int]) -> List[Department]:
+    """
+    Insert the whole tree in a single statement: one data-modifying CTE per level.
 
-    roots = [Department(parent=None)]
-    Department.objects.bulk_create(roots, batch_size=cfg.batch_size)
-    parents = list(Department.objects.all().only("id", "parent_id"))
-    created.extend(parents)
+    Each level takes its parents from the previous CTE's RETURNING rows, assigning the
+    i-th node to parent ``i % len(previous level)`` (same shape as the bulk_create path).
+    """
+    qn = connection.ops.quote_name
+    table = qn(Department._meta.db_table)
+    id_col = qn("id")
+    parent_col = qn("parent_id")
+    returning = f"RETURNING {id_col}, {parent_col}"
+
+    ctes = [
+        "l1 AS (INSERT INTO {} ({}) VALUES {} {})".format(
+            table, parent_col, ", ".join(["(NULL)"] * counts[0]), returning
+        )
+    ]
+    params: List[int] = []
+    for level in range(2, len(counts) + 1):
+        ctes.append(
+            f"l{level} AS ("
+            f"INSERT INTO {table} ({parent_col}) "
+            f"SELECT p.{id_col} FROM generate_series(0, %s - 1) AS g(i) "
+            f"JOIN (SELECT {id_col}, row_number() OVER (ORDER BY {id_col}) - 1 AS rn FROM l{level - 1}) AS p "
+            f"ON p.rn = g.i %% %s "
+            f"ORDER BY g.i "
+            f"{returning})"
+        )
+        params.extend([counts[level - 1], counts[level - 2]])
 
-    prev_level_nodes = parents[: counts[0]]  
-    start_level_index = 1
+    sql = "WITH {} {} ORDER BY {}".format(
+        ", ".join(ctes),
+        " UNION ALL ".join(f"SELECT {id_col}, {parent_col} FROM l{level}" for level in range(1, len(counts) + 1)),
+        id_col,
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    return [Department(id=dep_id, parent_id=parent_id) for dep_id, parent_id in rows]
+
+
+def _bulk_create_department_levels(cfg: SeedConfig, counts: Sequence[int]) -> List[Department]:
+    """Level-by-level bulk_create fallback for non-PostgreSQL backends."""
+    roots = [Department(parent=None) for _ in range(counts[0])]
+    created: List[Department] = _bulk_create_with_pks(Department, roots, cfg.batch_size)
+
+    prev_level_nodes = created
 
     for level in range(2, cfg.levels + 1):
         level_count = counts[level - 1]
@@ -161,53 +319,34 @@ def _ensure_department_tree(cfg: SeedConfig, rnd: random.Random) -> List[Departm
             parent = prev_level_nodes[i % len(prev_level_nodes)]
             to_create.append(Department(parent_id=parent.id))
 
-        Department.objects.bulk_create(to_create, batch_size=cfg.batch_size)
+        created_now = _bulk_create_with_pks(Department, to_create, cfg.batch_size)
 
-        total_expected = sum(counts[:level])
-        current_all = list(Department.objects.all().only("id", "parent_id").order_by("id")[:total_expected])
-        current_level_nodes = current_all[sum(counts[: level - 1]) : total_expected]
-
-        created = current_all
-        prev_level_nodes = current_level_nodes
-        start_level_index += 1
-
-    if len(created) != cfg.departments:
-        raise RuntimeError(f"Department creation mismatch: expected {cfg.departments}, got {len(created)}")
+        created.extend(created_now)
+        prev_level_nodes = created_now
 
     return created
 
 
 def _seed_employees(
     cfg: SeedConfig,
-    rnd: random.Random,
     roles: Sequence[Role],
     departments: Sequence[Department],
 ) -> None:
-    """Bulk-create employees distributed across departments."""
+    """
+    Insert employees distributed across departments (COPY on PostgreSQL, bulk_create elsewhere).
+
+    On PostgreSQL with --workers > 1 the rows are split into chunks that are generated and
+    loaded by separate processes, each on its own connection and in its own transaction.
+    """
     if not roles:
         raise RuntimeError("No roles available for employee generation.")
     if not departments:
         raise RuntimeError("No departments available for employee generation.")
 
-    first_names = [
-        "Данил", "Иван", "Глеб", "Святослав", "Петр", "Николай", "Августин", 
-        "Икакий", "Александр", "Матвей"
-    ]
-    last_names = [
-        "Федоров", "Якимов", "Петров", "Сапожников", "Курдюмов", "Хлебников", 
-        "Исаев", "Пушкарев"
-    ]
-
-    middle_names = [
-        "Евгеньевич", "Сергеевич", "Александрович", "Иванович", "Глебович",
-        "Святославович", "Николаевич", "Августинович"
-    ]
     role_ids_defaults: List[Tuple[int, int]] = [(r.id, r.default_salary) for r in roles]
     dept_ids: List[int] = [d.id for d in departments]
 
     now = timezone.now()
-    total = cfg.employees
-    batch_size = cfg.batch_size
 
     existing_count = Employee.objects.count()
     if existing_count != 0:
@@ -216,33 +355,132 @@ def _seed_employees(
             f"Use --truncate to reset before seeding, or clear employees manually."
         )
 
-    created = 0
-    dept_count = len(dept_ids)
+    with _without_employee_indexes():
+        _load_employees(cfg, role_ids_defaults, dept_ids, now)
+
+
+def _load_employees(
+    cfg: SeedConfig,
+    role_ids_defaults: List[Tuple[int, int]],
+    dept_ids: List[int],
+    now: datetime,
+) -> None:
+    blocks = -(-cfg.employees // cfg.batch_size)
+    workers = min(cfg.workers, blocks)
+    if workers == 1 or connection.vendor != "postgresql" or connection.in_atomic_block:
+        _write_employee_rows(cfg, _employee_rows(cfg, role_ids_defaults, dept_ids, now, 0, blocks))
+        return
+
+    # Workers get contiguous runs of whole blocks; every block is seeded from its own index,
+    # so the rows are the same as in a single-process run.
+    per_worker, extra = divmod(blocks, workers)
+    tasks: List[_EmployeeChunk] = []
+    first_block = 0
+    for i in range(workers):
+        block_count = per_worker + (1 if i < extra else 0)
+        tasks.append((cfg, role_ids_defaults, dept_ids, now, first_block, block_count))
+        first_block += block_count
+
+    # Children must not share the parent's socket: close it and let each worker reconnect.
+    connection.close()
+    with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as executor:
+        for _ in executor.map(_seed_employee_chunk, tasks):
+            pass
+
+
+@contextmanager
+def _without_employee_indexes() -> Iterator[None]:
+    """
+    Drop every secondary index on the employee table for a bulk load and rebuild them afterwards.
 
-    while created < total:
-        remaining = total - created
-        n = batch_size if remaining > batch_size else remaining
+    That covers Meta.indexes and the indexes Django adds for the ForeignKeys; only indexes that
+    back a constraint (the primary key) are kept. Definitions are read from the catalog and
+    replayed as-is. PostgreSQL only. Inside a transaction a failed load is left to the
+    rollback, which also restores the dropped indexes.
+    """
+    if connection.vendor != "postgresql":
+        yield
+        return
 
-        employees_batch: List[Employee] = []
-        employees_batch_extend = employees_batch.append
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT i.relname, pg_get_indexdef(ix.indexrelid)
+            FROM pg_index ix
+            JOIN pg_class i ON i.oid = ix.indexrelid
+            WHERE ix.indrelid = %s::regclass
+              AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = ix.indexrelid)
+            ORDER BY i.relname
+            """,
+            [qn(Employee._meta.db_table)],
+        )
+        indexes = cursor.fetchall()
 
-        for i in range(n):
-            dept_id = dept_ids[(created + i) % dept_count]
+    rebuild_on_error = not connection.in_atomic_block
 
-            role_id, default_salary = role_ids_defaults[rnd.randrange(len(role_ids_defaults))]
+    with transaction.atomic(), connection.cursor() as cursor:
+        for name, _ in indexes:
+            cursor.execute(f"DROP INDEX {qn(name)}")
 
-            salary = default_salary + rnd.randint(0, 120_000)
+    def rebuild() -> None:
+        with transaction.atomic(), connection.cursor() as cursor:
+            for _, definition in indexes:
+                cursor.execute(definition)
 
-            fn = first_names[rnd.randrange(len(first_names))]
-            ln = last_names[rnd.randrange(len(last_names))]
-            mn = middle_names[rnd.randrange(len(middle_names))]
-            full_name = f"{fn} {ln} {mn} #{created + i + 1}"
+    try:
+        yield
+    except BaseException:
+        if rebuild_on_error:
+            rebuild()
+        raise
+    rebuild()
 
-            days_back = rnd.randint(0, 3650)
-            seconds_back = rnd.randint(0, 24 * 3600 - 1)
-            employment_date = now - timedelta(days=days_back, seconds=seconds_back)
 
-            employees_batch_extend(
+def _seed_employee_chunk(task: _EmployeeChunk) -> int:
+    """ProcessPoolExecutor entry point: generate and load one run of employee blocks."""
+    cfg, role_ids_defaults, dept_ids, now, first_block, block_count = task
+    try:
+        with transaction.atomic():
+            _write_employee_rows(
+                cfg, _employee_rows(cfg, role_ids_defaults, dept_ids, now, first_block, block_count)
+            )
+    finally:
+        connection.close()
+    return block_count
+
+
+def _block_seed(seed: int, block: int) -> int:
+    """Derive a stable, non-negative seed for one block of employees from (seed, block)."""
+    digest = hashlib.sha256(f"{seed}:{block}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def _employee_rows(
+    cfg: SeedConfig,
+    role_ids_defaults: Sequence[Tuple[int, int]],
+    dept_ids: Sequence[int],
+    now: datetime,
+    first_block: int,
+    block_count: int,
+) -> Iterator[List[EmployeeRow]]:
+    """Pick the NumPy generator when available, the pure-Python one otherwise."""
+    if np is not None:
+        return _numpy_employee_row_batches(cfg, role_ids_defaults, dept_ids, now, first_block, block_count)
+    return _employee_row_batches(cfg, role_ids_defaults, dept_ids, now, first_block, block_count)
+
+
+def _write_employee_rows(cfg: SeedConfig, batches: Iterable[List[EmployeeRow]]) -> None:
+    if connection.vendor == "postgresql":
+        if cfg.use_copy:
+            _copy_employee_rows(batches)
+        else:
+            _insert_employee_rows(cfg, batches)
+        return
+
+    for batch in batches:
+        Employee.objects.bulk_create(
+            [
                 Employee(
                     full_name=full_name,
                     role_id=role_id,
@@ -250,7 +488,164 @@ def _seed_employees(
                     salary=salary,
                     department_id=dept_id,
                 )
+                for full_name, role_id, employment_date, salary, dept_id in batch
+            ],
+            batch_size=_safe_batch(Employee, cfg.batch_size),
+        )
+
+
+def _employee_row_batches(
+    cfg: SeedConfig,
+    role_ids_defaults: Sequence[Tuple[int, int]],
+    dept_ids: Sequence[int],
+    now: datetime,
+    first_block: int,
+    block_count: int,
+) -> Iterator[List[EmployeeRow]]:
+    """
+    Yield one batch of employee rows (EMPLOYEE_COLUMNS order) per block.
+
+    Block ``b`` holds rows ``b * cfg.batch_size`` up to the next block or cfg.employees and is
+    drawn from its own generator seeded with _block_seed(cfg.seed, b).
+    """
+    batch_size = cfg.batch_size
+
+    # Hot loop: bind everything it touches to locals.
+    role_ids_defaults = tuple(role_ids_defaults)
+    dept_ids = tuple(dept_ids)
+    dept_count = len(dept_ids)
+    name_prefixes = _NAME_PREFIXES
+    _timedelta = timedelta
+
+    for block in range(first_block, first_block + block_count):
+        created = block * batch_size
+        n = min(batch_size, cfg.employees - created)
+
+        rnd = random.Random(_block_seed(cfg.seed, block))
+        choices = rnd.choices
+        randrange = rnd.randrange
+
+        # Draw each column for the whole batch at once: random.choices loops in C.
+        role_picks = choices(role_ids_defaults, k=n)
+        name_picks = choices(name_prefixes, k=n)
+        salary_offsets = [randrange(120_001) for _ in range(n)]
+        days_back = [randrange(3651) for _ in range(n)]
+        seconds_back = [randrange(24 * 3600) for _ in range(n)]
+
+        employees_batch: List[EmployeeRow] = []
+        append = employees_batch.append
+
+        for i, (role_id, default_salary), name_prefix, salary_offset, days, seconds in zip(
+            range(created, created + n),
+            role_picks, name_picks, salary_offsets, days_back, seconds_back,
+        ):
+            append((
+                name_prefix + str(i + 1),
+                role_id,
+                now - _timedelta(days=days, seconds=seconds),
+                default_salary + salary_offset,
+                dept_ids[i % dept_count],
+            ))
+
+        yield employees_batch
+
+
+def _numpy_employee_row_batches(
+    cfg: SeedConfig,
+    role_ids_defaults: Sequence[Tuple[int, int]],
+    dept_ids: Sequence[int],
+    now: datetime,
+    first_block: int,
+    block_count: int,
+) -> Iterator[List[EmployeeRow]]:
+    """
+    Same row layout and blocks as _employee_row_batches, with each block's columns drawn by NumPy.
+
+    NumPy uses its own random stream, so the values differ from the pure-Python generator for
+    the same seed. Only the final tuple assembly runs per row in Python; values are converted
+    with ``tolist()`` so database adapters receive plain Python objects.
+    """
+    role_ids = np.array([role_id for role_id, _ in role_ids_defaults])
+    default_salaries = np.array([default_salary for _, default_salary in role_ids_defaults])
+    all_name_prefixes = np.asarray(_NAME_PREFIXES, dtype=object)
+    dept_array = np.asarray(dept_ids)
+    base_date = np.datetime64(now.replace(tzinfo=None), "us")
+    tz = now.tzinfo
+
+    for block in range(first_block, first_block + block_count):
+        start = block * cfg.batch_size
+        n = min(cfg.batch_size, cfg.employees - start)
+        rng = np.random.default_rng(_block_seed(cfg.seed, block))
+
+        role_idx = rng.integers(0, len(role_ids_defaults), size=n)
+        salaries = default_salaries[role_idx] + rng.integers(0, 120_001, size=n)
+        name_prefixes = all_name_prefixes[rng.integers(0, len(_NAME_PREFIXES), size=n)]
+        departments = dept_array[np.arange(start, start + n) % len(dept_ids)]
+
+        # Up to 3650 days plus a time of day back from `now`, in whole seconds.
+        seconds_back = rng.integers(0, 3651 * 24 * 3600, size=n)
+        employment_dates = base_date - seconds_back.astype("timedelta64[s]")
+
+        yield [
+            (name_prefix + str(i + 1), role_id, employment_date.replace(tzinfo=tz), salary, dept_id)
+            for i, name_prefix, role_id, employment_date, salary, dept_id in zip(
+                range(start, start + n),
+                name_prefixes.tolist(),
+                role_ids[role_idx].tolist(),
+                employment_dates.tolist(),
+                salaries.tolist(),
+                departments.tolist(),
             )
+        ]
+
+
+def _copy_employee_rows(batches: Iterable[List[EmployeeRow]]) -> None:
+    """
+    Stream employee rows into PostgreSQL with COPY ... FROM STDIN.
+
+    COPY skips the INSERT parser and per-row ORM overhead; one COPY is issued per batch,
+    reusing a single text buffer.
+    """
+    qn = connection.ops.quote_name
+    sql = "COPY {} ({}) FROM STDIN".format(
+        qn(Employee._meta.db_table),
+        ", ".join(qn(c) for c in EMPLOYEE_COLUMNS),
+    )
 
-        Employee.objects.bulk_create(employees_batch, batch_size=cfg.batch_size)
-        created += n
+    buf = io.StringIO()
+    with connection.cursor() as cursor:
+        for batch in batches:
+            buf.seek(0)
+            buf.truncate(0)
+            buf.writelines(_copy_line(row) for row in batch)
+            buf.seek(0)
+            cursor.copy_expert(sql, buf)
+
+
+def _insert_employee_rows(cfg: SeedConfig, batches: Iterable[List[EmployeeRow]]) -> None:
+    """
+    Insert employee rows with psycopg2's execute_values (multi-row INSERT ... VALUES).
+
+    For setups where COPY is not allowed; still avoids building Employee instances and
+    Django's per-object SQL compilation.
+    """
+    from psycopg2.extras import execute_values
+
+    qn = connection.ops.quote_name
+    sql = "INSERT INTO {} ({}) VALUES %s".format(
+        qn(Employee._meta.db_table),
+        ", ".join(qn(c) for c in EMPLOYEE_COLUMNS),
+    )
+
+    with connection.cursor() as cursor:
+        for batch in batches:
+            execute_values(cursor.cursor, sql, batch, page_size=cfg.batch_size)
+
+
+def _copy_line(row: EmployeeRow) -> str:
+    """Format a row for COPY text format (tab-separated, backslash-escaped)."""
+    full_name, role_id, employment_date, salary, dept_id = row
+    return (
+        f"{full_name.translate(_COPY_ESCAPES)}\t{role_id}\t{employment_date.isoformat()}"
+        f"\t{salary}\t{dept_id}\n"
+    )
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import connection, models
 from django.utils import timezone
 
 
@@ -48,11 +48,25 @@ class Department(models.Model):
         if self.parent_id == self.pk:
             raise ValidationError({"parent": "A department cannot be its own parent."})
 
-        ancestor = self.parent
-        while ancestor is not None:
-            if ancestor.pk == self.pk:
-                raise ValidationError({"parent": "Cycle detected in department hierarchy."})
-            ancestor = ancestor.parent
+        if self._is_ancestor_of(self.parent_id):
+            raise ValidationError({"parent": "Cycle detected in department hierarchy."})
+
+    def _is_ancestor_of(self, department_id: int) -> bool:
+        """Whether this department appears in department_id's ancestor chain (one recursive query)."""
+        qn = connection.ops.quote_name
+        table = qn(self._meta.db_table)
+        # UNION (not UNION ALL) so a cycle already stored in the table still terminates.
+        sql = (
+            f"WITH RECURSIVE ancestors (id, parent_id) AS ("
+            f"SELECT {qn('id')}, {qn('parent_id')} FROM {table} WHERE {qn('id')} = %s "
+            f"UNION "
+            f"SELECT d.{qn('id')}, d.{qn('parent_id')} FROM {table} d "
+            f"JOIN ancestors a ON d.{qn('id')} = a.parent_id"
+            f") SELECT 1 FROM ancestors WHERE id = %s LIMIT 1"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [department_id, self.pk])
+            return cursor.fetchone() is not None
 
 
 class Employee(models.Model):
@@ -92,13 +106,15 @@ class Employee(models.Model):
         if self.role_id is None:
             raise ValidationError({"role": "Role must be provided."})
 
-        role_default = getattr(self.role, "default_salary", None)
+        # Use the cached role when there is one; otherwise fetch only the default salary.
+        if Employee.role.is_cached(self):
+            role_default = self.role.default_salary
+        else:
+            role_default = (
+                Role.objects.filter(pk=self.role_id).values_list("default_salary", flat=True).first()
+            )
         if role_default is not None and self.salary < role_default:
             raise ValidationError(
                 {"salary": f"Salary must be at least the role default salary ({role_default})."}
             )
 
-    def save(self, *args, **kwargs):
-        self.full_clean()
-        return super().save(*args, **kwargs)
-
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_department_tree_cache
+from .models import Department, Employee
+
+
+# No post_delete receiver for Employee on purpose: it would disable Django's fast delete for
+# the Department -> Employee cascade (one query and one signal per employee). Department
+# deletes cover cascades; direct employee deletes show up within the cache TTL.
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+@receiver(post_save, sender=Employee)
+def _invalidate_department_tree(sender, **kwargs) -> None:
+    invalidate_department_tree_cache()
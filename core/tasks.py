@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+
+from .cache import SEED_LOCK_KEY, SEED_LOCK_TIMEOUT
+
+try:
+    from celery import shared_task
+except ImportError:  # Celery is optional: without it (or a broker) the seed runs in a thread.
+    shared_task = None
+
+
+def run_seed(options: Dict[str, Any]) -> None:
+    """Run the tree_init command (the single entry point for seeding) and release the seed lock."""
+    options = dict(options)
+    # Celery's prefork pool runs tasks in daemonic processes, which cannot start the
+    # command's own process pool, so load employees in-process unless asked otherwise.
+    options.setdefault("workers", 1)
+    try:
+        call_command("tree_init", **options)
+    finally:
+        cache.delete(SEED_LOCK_KEY)
+
+
+if shared_task is not None:
+    run_seed = shared_task(run_seed)
+
+
+def enqueue_seed(options: Dict[str, Any]) -> bool:
+    """
+    Start seeding without blocking the caller; return False if a seed is already running.
+
+    Uses Celery only when it is installed and CELERY_BROKER_URL is set: an installed but
+    unconfigured Celery would fall back to its default local AMQP broker and fail.
+    """
+    if not cache.add(SEED_LOCK_KEY, True, SEED_LOCK_TIMEOUT):
+        return False
+
+    try:
+        if shared_task is not None and getattr(settings, "CELERY_BROKER_URL", None):
+            run_seed.delay(options)
+        else:
+            threading.Thread(target=_run_seed_in_thread, args=(options,), daemon=True).start()
+    except BaseException:
+        cache.delete(SEED_LOCK_KEY)
+        raise
+    return True
+
+
+def _run_seed_in_thread(options: Dict[str, Any]) -> None:
+    try:
+        run_seed(options)
+    finally:
+        connection.close()
@@ -1,3 +1,93 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from . import tasks
+from .cache import SEED_LOCK_KEY
+
+
+class SeedViewTests(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.staff = User.objects.create_user("staff", password="secret", is_staff=True)
+        self.user = User.objects.create_user("user", password="secret")
+        self.url = reverse("seed")
+
+    @mock.patch("core.views.enqueue_seed")
+    def test_anonymous_post_is_redirected_to_login(self, enqueue_seed):
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, 302)
+        enqueue_seed.assert_not_called()
+
+    @mock.patch("core.views.enqueue_seed")
+    def test_non_staff_post_is_redirected_to_login(self, enqueue_seed):
+        self.client.force_login(self.user)
+
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, 302)
+        enqueue_seed.assert_not_called()
+
+    @mock.patch("core.views.enqueue_seed")
+    def test_staff_get_is_not_allowed(self, enqueue_seed):
+        self.client.force_login(self.staff)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 405)
+        enqueue_seed.assert_not_called()
+
+    @mock.patch("core.views.enqueue_seed")
+    def test_staff_post_queues_truncating_seed(self, enqueue_seed):
+        self.client.force_login(self.staff)
+
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, 202)
+        enqueue_seed.assert_called_once_with({"truncate": True})
+
+    @mock.patch("core.views.enqueue_seed", return_value=False)
+    def test_staff_post_while_seed_running_conflicts(self, enqueue_seed):
+        self.client.force_login(self.staff)
+
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, 409)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    CELERY_BROKER_URL=None,
+)
+class EnqueueSeedTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @mock.patch("core.tasks.threading.Thread")
+    def test_without_broker_runs_in_thread(self, thread):
+        tasks.enqueue_seed({"truncate": True})
+
+        thread.assert_called_once_with(
+            target=tasks._run_seed_in_thread, args=({"truncate": True},), daemon=True
+        )
+        thread.return_value.start.assert_called_once_with()
+
+    @mock.patch("core.tasks.threading.Thread")
+    def test_second_seed_is_refused_while_first_runs(self, thread):
+        self.assertTrue(tasks.enqueue_seed({"truncate": True}))
+        self.assertFalse(tasks.enqueue_seed({"truncate": True}))
+
+        thread.assert_called_once()
+
+    @mock.patch("core.tasks.call_command", side_effect=RuntimeError("boom"))
+    def test_run_seed_releases_lock_on_failure(self, call_command):
+        cache.add(SEED_LOCK_KEY, True)
+
+        with self.assertRaises(RuntimeError):
+            tasks.run_seed({"truncate": True})
+
+        self.assertIsNone(cache.get(SEED_LOCK_KEY))
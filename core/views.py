@@ -3,11 +3,16 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Sequence
 
-from django.http import HttpRequest, HttpResponse
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core.cache import cache
+from django.db.models import Count
+from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import render
-from django.views.decorators.http import require_GET
+from django.views.decorators.http import require_GET, require_POST
 
+from .cache import DEPARTMENT_TREE_CACHE_KEY, DEPARTMENT_TREE_CACHE_TTL
 from .models import Department
+from .tasks import enqueue_seed
 
 
 BOOTSTRAP_CSS_CDN = "https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css"
@@ -26,15 +31,18 @@ class DepartmentNode:
 
 
 def _build_department_tree(departments: Sequence[Department]) -> List[DepartmentNode]:
+    """Build the tree from departments annotated with ``emp_count``."""
     node_by_id: Dict[int, DepartmentNode] = {}
     parent_by_id: Dict[int, Optional[int]] = {}
 
     for d in departments:
         if d.id is None:
             raise ValueError("Encountered Department without an id while building tree.")
-        node_by_id[d.id] = DepartmentNode(id=d.id, label=f"{str(d)} [{d.employees.count()} employees]")
+        node_by_id[d.id] = DepartmentNode(id=d.id, label=f"{str(d)} [{d.emp_count} employees]")
         parent_by_id[d.id] = d.parent_id
 
+    # `departments` must be ordered by id: node_by_id keeps insertion order, so roots and
+    # every children list come out id-sorted without a post-sort.
     roots: List[DepartmentNode] = []
     for dep_id, node in node_by_id.items():
         parent_id = parent_by_id[dep_id]
@@ -46,19 +54,20 @@ def _build_department_tree(departments: Sequence[Department]) -> List[Department
                 raise ValueError(f"Department {dep_id} references missing parent {parent_id}.")
             parent_node.children.append(node)
 
-    def sort_rec(nodes: List[DepartmentNode]) -> None:
-        nodes.sort(key=lambda n: n.id)
-        for n in nodes:
-            sort_rec(n.children)
-
-    sort_rec(roots)
     return roots
 
 
 @require_GET
 def index(request: HttpRequest) -> HttpResponse:
-    departments = list(Department.objects.all().only("id", "parent_id").order_by("id"))
-    tree = _build_department_tree(departments)
+    tree = cache.get(DEPARTMENT_TREE_CACHE_KEY)
+    if tree is None:
+        departments = list(
+            Department.objects.annotate(emp_count=Count("employees"))
+            .only("id", "parent_id")
+            .order_by("id")
+        )
+        tree = _build_department_tree(departments)
+        cache.set(DEPARTMENT_TREE_CACHE_KEY, tree, DEPARTMENT_TREE_CACHE_TTL)
 
     return render(
         request,
@@ -69,3 +78,12 @@ def index(request: HttpRequest) -> HttpResponse:
             "bootstrap_js_cdn": BOOTSTRAP_JS_BUNDLE_CDN,
         },
     )
+
+
+@staff_member_required
+@require_POST
+def seed(request: HttpRequest) -> HttpResponse:
+    """Queue a full reseed (tree_init --truncate) and return immediately."""
+    if not enqueue_seed({"truncate": True}):
+        return JsonResponse({"status": "already running"}, status=409)
+    return JsonResponse({"status": "queued"}, status=202)